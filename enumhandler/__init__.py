@@ -1,6 +1,33 @@
+from abc import ABCMeta
 from enum import Enum, auto
-from inspect import getmembers
-from typing import Callable, Generic, Self, Type, TypeVar
+from types import MethodType
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    MutableMapping,
+    Optional,
+    Self,
+    Type,
+    TypeVar,
+)
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:
+    from typing import Generic as _Generic
+else:
+
+    class _Generic:
+        """
+        Stands in for ``typing.Generic`` at runtime. The type parameters of
+        ``EnumHandler`` only matter to type checkers, and ``Generic`` has a per-subclass
+        cost; this keeps ``EnumHandler[...]`` subscriptable without it.
+        """
+
+        __slots__ = ()
+
+        def __class_getitem__(cls, params):
+            return cls
+
 
 E = TypeVar("E", bound=Type[Enum])
 M = TypeVar("M", bound=Enum)
@@ -20,14 +47,36 @@ class CacheStrategy(Enum):
 
     LAZY_CACHE
         Instances are cached on-demand when they are created.
+
+    WEAK_CACHE
+        Instances are cached on-demand when they are created, but only for as long as
+        they're referenced elsewhere.
     """
 
     NO_CACHE = auto()
     EAGER_CACHE = auto()
     LAZY_CACHE = auto()
+    WEAK_CACHE = auto()
+
 
+class EnumHandlerMeta(ABCMeta):
+    """
+    The metaclass of ``EnumHandler``. Instantiation only calls ``__new__``: the
+    ``__new__`` implementations installed on each subclass initialize any instance they
+    create, so returning a cached instance doesn't run ``__init__`` again.
 
-class EnumHandler(Generic[E, M, O]):
+    It derives from ``ABCMeta`` so that handlers can also inherit from abstract base
+    classes. Mixins with any other metaclass, including ``typing.Protocol`` subclasses,
+    need a metaclass deriving from both.
+    """
+
+    def __call__(cls, enum_element):
+        # Type checkers resolve cls.__new__ to the metaclass's own __new__ here, rather
+        # than the EnumHandler subclass's.
+        return cls.__new__(cls, enum_element)  # pyright: ignore[reportCallIssue]
+
+
+class EnumHandler(_Generic[E, M, O], metaclass=EnumHandlerMeta):
     """
     A callable handler for the members of an enum. Implementations should subclass this
     class, and then use the ``EnumHandler.register`` decorator (also exported as
@@ -62,42 +111,41 @@ class EnumHandler(Generic[E, M, O]):
         adder(3, 4, 5)
     """
 
+    # Subclasses don't declare __slots__, so their instances still get a __dict__ for
+    # any state their handlers keep.
+    #
+    # Each instance stores its bound handler in the _call slot, so calling an instance
+    # doesn't look the handler up again.
+    __slots__ = ("_call", "__weakref__")
+
     _final: bool = False
     _handlers: dict[E, Callable[..., O]]
-    _handler: Callable[..., O]
 
     _cache_strategy: CacheStrategy
-    _instance_cache: dict[E, Self]
+    # The lazy cache keeps its instances in _instance_cache_list, by position; every
+    # other strategy maps members to instances in _instance_cache.
+    _instance_cache: MutableMapping[Enum, Self]
+    _instance_cache_list: list[Optional[Self]]
 
-    def __new__(cls, enum_element):
-        if cls._cache_strategy is CacheStrategy.NO_CACHE:
-            return super().__new__(cls)
+    _members: tuple[Enum, ...]
+    _member_pos: dict[Enum, int]
+    _instance_tuple: tuple[Self, ...]
 
-        try:
-            # Return the cached instance, if possible.
-            return cls._instance_cache[enum_element]
-        except KeyError:
-            # Instantiate, cache and return a new instance.
-            instance = super().__new__(cls)
-            instance.__init__(enum_element)
-            cls._instance_cache[enum_element] = instance
-            return instance
+    def __new__(cls, enum_element):
+        # Subclasses have a __new__ installed by __init_subclass__, so this is only
+        # reached when instantiating EnumHandler itself.
+        raise NotImplementedError("EnumHandler must be subclassed and instantiated.")
 
     def __init__(self, enum_element):
-        self._handler = self._handlers[enum_element]
+        handler = self._handlers[enum_element]
+        self._call = MethodType(handler, self)
 
-        if handler_doc := self._handler.__doc__:
+        # Instances document their handler; the class keeps its own docstring.
+        if handler_doc := handler.__doc__:
             self.__doc__ = handler_doc
 
     def __call__(self, *args, **kwargs) -> O:
-        try:
-            return self._handler(self, *args, **kwargs)
-        except AttributeError as ex:
-            # self._handler is set within __init_subclass__, so this indicates that the
-            # parent class is being called.
-            raise NotImplementedError(
-                "EnumHandler must be subclassed and instantiated."
-            ) from ex
+        return self._call(*args, **kwargs)
 
     def __init_subclass__(
         cls, *, enum: E, cache: CacheStrategy = CacheStrategy.EAGER_CACHE
@@ -107,42 +155,100 @@ class EnumHandler(Generic[E, M, O]):
         registered handlers, and raises errors for duplicates, non-exhaustive handlers,
         or members of unexpected enum classes.
         """
+        if "__new__" in cls.__dict__:
+            # __new__ is replaced below with one specialized for the cache strategy,
+            # which would silently discard the subclass's own.
+            raise TypeError(
+                f"EnumHandler {cls.__name__} can't define __new__; override __init__ "
+                "instead."
+            )
+
+        # Iterate over the enum once; EnumMeta's __iter__ and __contains__ are
+        # comparatively slow. Aliases are left out, as they're the same members.
+        cls._members = members = tuple(enum)
+        members_set = frozenset(members)
+
         cls._cache_strategy = cache
         cls._final = True
         cls._handlers = {}
-        cls._instance_cache = {}
 
-        for method in (attr for _, attr in getmembers(cls) if callable(attr)):
+        # Collect the class attributes the way attribute lookup would see them, but from
+        # the class dicts directly; unlike inspect.getmembers, this doesn't sort or
+        # evaluate descriptors.
+        namespace = {}
+        for klass in reversed(cls.__mro__[:-1]):
+            namespace.update(vars(klass))
+
+        for method in namespace.values():
             # The _handles attribute is set on callables by the @handles decorator. If
             # it's not present, it implies this is a "normal" method rather than a
             # registered handler.
-            try:
-                for enum_value in method._handles:
-                    if enum_value in cls._handlers:
-                        raise InvalidEnumHandler(
-                            f"Multiple handlers defined for {enum_value}."
-                        )
-
-                    cls._handlers[enum_value] = method
-            except AttributeError:
-                pass
-
-        if unexpected := {key for key in cls._handlers if key not in enum}:
+            handles_attr = getattr(method, "_handles", None)
+            if handles_attr is None:
+                continue
+
+            for enum_value in handles_attr:
+                if enum_value in cls._handlers:
+                    raise InvalidEnumHandler(
+                        f"Multiple handlers defined for {enum_value}."
+                    )
+
+                cls._handlers[enum_value] = method
+
+        if unexpected := cls._handlers.keys() - members_set:
             raise InvalidEnumHandler(
                 f"EnumHandler {cls.__name__} is parameterized with {enum} but has a "
                 "handler registered for non-members of that enum: "
                 + ", ".join(str(u) for u in unexpected)
             )
 
-        if missing := {entry for entry in enum if entry not in cls._handlers}:
+        if missing := members_set.difference(cls._handlers):
             raise InvalidEnumHandler(
                 f"EnumHandler {cls.__name__} is not exhaustive over {enum.__name__}. "
                 f"Missing entries: {', '.join(str(m) for m in missing)}"
             )
 
+        # Cached instances are stored by the member's position in the enum. When the
+        # values are 1..n, the value gives the position; otherwise, or for anything that
+        # isn't one of the members themselves, it's looked up.
+        cls._member_pos = {member: pos for pos, member in enumerate(members)}
+        ordinal = _has_ordinal_values(members)
+
+        if cache is CacheStrategy.NO_CACHE:
+            cls._instance_cache = {}
+
+        if cache is CacheStrategy.LAZY_CACHE:
+            cls._instance_cache_list = [None] * len(members)
+
+        if cache is CacheStrategy.WEAK_CACHE:
+            cls._instance_cache = WeakValueDictionary()
+
         if cache is CacheStrategy.EAGER_CACHE:
-            for member in enum:
-                cls(member)
+            # Each instance holds its bound handler, so a lookup here is the only work
+            # left between instantiation and calling the handler.
+            cls._instance_tuple = tuple(_nocache_new(cls, member) for member in members)
+            cls._instance_cache = dict(zip(members, cls._instance_tuple))
+
+        # The strategy is fixed at definition time, so pick the matching __new__ now
+        # rather than branching on it for every instantiation.
+        if cache is CacheStrategy.NO_CACHE:
+            new = _nocache_new
+        elif cache is CacheStrategy.WEAK_CACHE:
+            new = _weak_new(cls._instance_cache)
+        elif cache is CacheStrategy.LAZY_CACHE:
+            new = (_lazy_ordinal_new if ordinal else _lazy_new)(
+                members,
+                cls._member_pos,
+                cls._instance_cache_list,
+            )
+        else:
+            new = (
+                _eager_ordinal_new(members, cls._member_pos, cls._instance_tuple)
+                if ordinal
+                else _eager_new(cls._member_pos, cls._instance_tuple)
+            )
+
+        cls.__new__ = staticmethod(new)
 
     @classmethod
     def register(cls, *enum_values: M):
@@ -161,6 +267,111 @@ class EnumHandler(Generic[E, M, O]):
         return _deco
 
 
+def _nocache_new(cls, enum_element):
+    instance = object.__new__(cls)
+    instance.__init__(enum_element)
+    return instance
+
+
+# The factories below build the __new__ installed on each subclass. The cache and
+# lookup tables are closure variables, and their methods are bound up front, so a
+# lookup doesn't go through attribute loads on the class.
+
+
+def _lazy_new(members: tuple, member_pos: dict, cache: list):
+    position_of = member_pos.__getitem__
+
+    def __new__(cls, enum_element):
+        position = position_of(enum_element)
+        instance = cache[position]
+        if instance is None:
+            # Instantiate, cache and return a new instance.
+            instance = cache[position] = _nocache_new(cls, members[position])
+
+        return instance
+
+    return __new__
+
+
+def _lazy_ordinal_new(members: tuple, member_pos: dict, cache: list):
+    position_of = member_pos.__getitem__
+
+    def __new__(cls, enum_element):
+        # See _eager_ordinal_new.
+        try:
+            position = enum_element._value_ - 1
+            if members[position] is not enum_element:
+                position = position_of(enum_element)
+        except (AttributeError, IndexError, TypeError):
+            position = position_of(enum_element)
+
+        instance = cache[position]
+        if instance is None:
+            # Instantiate, cache and return a new instance.
+            instance = cache[position] = _nocache_new(cls, members[position])
+
+        return instance
+
+    return __new__
+
+
+def _weak_new(cache: MutableMapping):
+    cache_get = cache.get
+    cache_set = cache.__setitem__
+
+    def __new__(cls, enum_element):
+        instance = cache_get(enum_element)
+        if instance is None:
+            # Instantiate, cache and return a new instance. The cache only holds a weak
+            # reference, so the instance is collected once the caller lets go of it.
+            instance = _nocache_new(cls, enum_element)
+            cache_set(enum_element, instance)
+
+        return instance
+
+    return __new__
+
+
+def _eager_new(member_pos: dict, instances: tuple):
+    position_of = member_pos.__getitem__
+
+    def __new__(cls, enum_element):
+        return instances[position_of(enum_element)]
+
+    return __new__
+
+
+def _eager_ordinal_new(members: tuple, member_pos: dict, instances: tuple):
+    position_of = member_pos.__getitem__
+
+    def __new__(cls, enum_element):
+        # The enum's values are 1..n, so the value is the index, and we skip the
+        # Python-level Enum.__hash__ that a dict lookup would involve. Anything else,
+        # such as a member of another enum that happens to share the value or a raw
+        # value that compares equal to a member (as with IntEnum), is looked up.
+        try:
+            position = enum_element._value_ - 1
+            if members[position] is enum_element:
+                return instances[position]
+        except (AttributeError, IndexError, TypeError):
+            pass
+
+        return instances[position_of(enum_element)]
+
+    return __new__
+
+
+def _has_ordinal_values(members: tuple[Enum, ...]) -> bool:
+    """
+    Returns whether the values of the given members are the integers 1..n in definition
+    order, as produced by ``auto()``.
+    """
+    return all(
+        type(member._value_) is int and member._value_ == pos
+        for pos, member in enumerate(members, start=1)
+    )
+
+
 class InvalidEnumHandler(ValueError):
     pass
 
@@ -1,6 +1,13 @@
+import functools
+import inspect
+import pickle
+import pydoc
+from abc import ABC, abstractmethod
+from typing import Protocol
+
 import pytest
 
-from enumhandler import EnumHandler, InvalidEnumHandler, handles
+from enumhandler import EnumHandler, EnumHandlerMeta, InvalidEnumHandler, handles
 
 from .enums import CapitalContinents, Capitals, Colors
 
@@ -44,6 +51,26 @@ def test_duplicate_definitions_fail():
                 return "duplicate"
 
 
+def test_repeated_members_fail():
+    with pytest.raises(InvalidEnumHandler):
+
+        class _(EnumHandler, enum=Colors):
+            @handles(Colors.RED, Colors.RED, Colors.GREEN, Colors.BLUE)
+            def color(self):
+                return "color"
+
+
+def test_aliased_handlers_fail():
+    with pytest.raises(InvalidEnumHandler):
+
+        class _(EnumHandler, enum=Colors):
+            @handles(Colors.RED, Colors.GREEN, Colors.BLUE)
+            def color(self):
+                return "color"
+
+            also_color = color
+
+
 EXPECTED_CONTINENTS = {
     Capitals.AMSTERDAM: "Europe",
     Capitals.CANBERRA: "Australia",
@@ -73,3 +100,273 @@ def test_using_reexported_handles_works():
             return True
 
     assert ColorHandler(Colors.BLUE)()
+
+
+def test_instantiating_enum_handler_fails():
+    with pytest.raises(NotImplementedError):
+        EnumHandler(Colors.RED)
+
+
+def test_instances_use_handler_docstrings():
+    class DocumentedColorName(EnumHandler, enum=Colors):
+        """Names colors."""
+
+        @handles(Colors.RED)
+        def red(self):
+            """The name of red."""
+            return "Red"
+
+        @handles(Colors.GREEN, Colors.BLUE)
+        def other(self):
+            return "Other"
+
+    assert DocumentedColorName.__doc__ == "Names colors."
+    assert DocumentedColorName(Colors.RED).__doc__ == "The name of red."
+    assert DocumentedColorName(Colors.BLUE).__doc__ == "Names colors."
+    assert "Names colors." in pydoc.plain(pydoc.render_doc(DocumentedColorName))
+
+
+def test_error_messages_list_offending_members():
+    with pytest.raises(InvalidEnumHandler, match="Missing entries: Colors.GREEN"):
+
+        class _(EnumHandler, enum=Colors):
+            @EnumHandler.register(Colors.RED, Colors.BLUE)
+            def color(self):
+                return "color"
+
+    with pytest.raises(InvalidEnumHandler, match="non-members .*: Capitals.TOKYO"):
+
+        class _(EnumHandler, enum=Colors):
+            @EnumHandler.register(Colors.RED, Colors.GREEN, Colors.BLUE)
+            def color(self):
+                return "color"
+
+            @EnumHandler.register(Capitals.TOKYO)
+            def city(self):
+                return "city"
+
+
+def test_invalid_enum_handler_errors_can_be_pickled():
+    with pytest.raises(InvalidEnumHandler) as excinfo:
+
+        class _(EnumHandler, enum=Colors):
+            @EnumHandler.register(Colors.RED)
+            def red(self):
+                return "red"
+
+    assert isinstance(excinfo.value.args[0], str)
+    assert str(pickle.loads(pickle.dumps(excinfo.value))) == str(excinfo.value)
+
+
+def test_nested_handler_classes_keep_their_own_handlers():
+    class OuterColorName(EnumHandler, enum=Colors):
+        @handles(Colors.RED)
+        def red(self):
+            return "Red"
+
+        class InnerCapitalContinent(EnumHandler, enum=Capitals):
+            @handles(*Capitals)
+            def anywhere(self):
+                return "Earth"
+
+        @handles(Colors.GREEN, Colors.BLUE)
+        def other(self):
+            return "Other"
+
+    assert OuterColorName(Colors.RED)() == "Red"
+    assert OuterColorName(Colors.BLUE)() == "Other"
+    assert OuterColorName.InnerCapitalContinent(Capitals.TOKYO)() == "Earth"
+
+
+def test_handlers_on_mixins_work():
+    class RedName:
+        @handles(Colors.RED)
+        def red(self):
+            return "Red"
+
+    class ColorName(RedName, EnumHandler, enum=Colors):
+        @handles(Colors.GREEN, Colors.BLUE)
+        def other(self):
+            return "Other"
+
+    assert ColorName(Colors.RED)() == "Red"
+    assert ColorName(Colors.GREEN)() == "Other"
+
+
+def test_subclassing_a_handler_keeps_its_handlers():
+    class ColorName(EnumHandler, enum=Colors):
+        @handles(Colors.RED)
+        def red(self):
+            return "Red"
+
+        @handles(Colors.GREEN, Colors.BLUE)
+        def other(self):
+            return "Other"
+
+    class ShoutedColorName(ColorName, enum=Colors):
+        @handles(Colors.RED)
+        def red(self):
+            return "RED"
+
+    assert ShoutedColorName(Colors.RED)() == "RED"
+    assert ShoutedColorName(Colors.BLUE)() == "Other"
+    assert ColorName(Colors.RED)() == "Red"
+
+
+def test_wrapped_and_reassigned_handlers_work():
+    def logged(fn):
+        @functools.wraps(fn)
+        def wrapper(self):
+            return f"wrapped:{fn(self)}"
+
+        return wrapper
+
+    @handles(Colors.GREEN, Colors.BLUE)
+    def other(self):
+        return "Other"
+
+    class ColorName(EnumHandler, enum=Colors):
+        @logged
+        @handles(Colors.RED)
+        def red(self):
+            return "Red"
+
+        not_red = other
+
+    assert ColorName(Colors.RED)() == "wrapped:Red"
+    assert ColorName(Colors.BLUE)() == "Other"
+
+
+def test_handlers_in_nested_helper_classes_are_ignored():
+    class ColorName(EnumHandler, enum=Colors):
+        class Helper:
+            @handles(Colors.RED)
+            def red(self):
+                return "Helper"
+
+        @handles(Colors.RED, Colors.GREEN, Colors.BLUE)
+        def name(self):
+            return "Color"
+
+    assert ColorName(Colors.RED)() == "Color"
+
+
+def test_abstract_base_class_mixins_work():
+    class Described(ABC):
+        @abstractmethod
+        def describe(self): ...
+
+    class DescribedColorName(EnumHandler, Described, enum=Colors):
+        def describe(self):
+            return "Color names"
+
+        @handles(Colors.RED, Colors.GREEN, Colors.BLUE)
+        def name(self):
+            return "Color"
+
+    assert isinstance(DescribedColorName(Colors.RED), Described)
+    assert DescribedColorName(Colors.RED).describe() == "Color names"
+
+
+def test_defining_new_fails():
+    with pytest.raises(TypeError):
+
+        class _(EnumHandler, enum=Colors):
+            def __new__(cls, enum_element):
+                return super().__new__(cls, enum_element)
+
+            @handles(Colors.RED, Colors.GREEN, Colors.BLUE)
+            def color(self):
+                return "color"
+
+
+def test_protocol_mixins_work_with_a_combined_metaclass():
+    class Named(Protocol):
+        def name(self) -> str: ...
+
+    with pytest.raises(TypeError, match="metaclass conflict"):
+
+        class _(EnumHandler, Named, enum=Colors):
+            @handles(Colors.RED, Colors.GREEN, Colors.BLUE)
+            def color(self):
+                return "color"
+
+    class NamedHandlerMeta(EnumHandlerMeta, type(Named)):
+        pass
+
+    class NamedColor(EnumHandler, Named, enum=Colors, metaclass=NamedHandlerMeta):
+        def name(self) -> str:
+            return "Colors"
+
+        @handles(Colors.RED, Colors.GREEN, Colors.BLUE)
+        def color(self):
+            return "color"
+
+    assert NamedColor(Colors.RED)() == "color"
+    assert NamedColor(Colors.RED).name() == "Colors"
+
+
+def test_subscripted_handlers_work():
+    assert EnumHandler[Colors, Colors, str] is EnumHandler
+
+    class ColorName(EnumHandler[Colors, Colors, str], enum=Colors):
+        @handles(Colors.RED, Colors.GREEN, Colors.BLUE)
+        def name(self) -> str:
+            return "color"
+
+    def describe(handler: EnumHandler[Colors, Colors, str]) -> str:
+        return handler()
+
+    assert describe(ColorName(Colors.RED)) == "color"
+
+
+def test_overridden_call_can_defer_to_handler():
+    class LoudColorName(EnumHandler, enum=Colors):
+        def __call__(self, *args, **kwargs):
+            return super().__call__(*args, **kwargs).upper()
+
+        @handles(Colors.RED)
+        def red(self):
+            """The name of red."""
+            return "Red"
+
+        @handles(Colors.GREEN, Colors.BLUE)
+        def other(self):
+            return "Other"
+
+    assert LoudColorName(Colors.RED)() == "RED"
+    assert LoudColorName(Colors.BLUE)() == "OTHER"
+    assert LoudColorName(Colors.RED).__doc__ == "The name of red."
+
+
+def test_instances_have_a_call_signature():
+    class ColorName(EnumHandler, enum=Colors):
+        @handles(Colors.RED, Colors.GREEN, Colors.BLUE)
+        def name(self, prefix):
+            return f"{prefix}color"
+
+    handler = ColorName(Colors.RED)
+    assert list(inspect.signature(handler).parameters) == ["args", "kwargs"]
+    assert handler(prefix="a ") == "a color"
+
+
+def test_mixins_cant_declare_slots():
+    class Unslotted:
+        __slots__ = ()
+
+    class Slotted:
+        __slots__ = ("name",)
+
+    class ColorName(EnumHandler, Unslotted, enum=Colors):
+        @handles(Colors.RED, Colors.GREEN, Colors.BLUE)
+        def color(self):
+            return "color"
+
+    assert ColorName(Colors.RED)() == "color"
+
+    with pytest.raises(TypeError, match="lay-?out conflict"):
+
+        class _(EnumHandler, Slotted, enum=Colors):
+            @handles(Colors.RED, Colors.GREEN, Colors.BLUE)
+            def color(self):
+                return "color"
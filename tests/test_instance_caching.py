@@ -1,7 +1,11 @@
+import gc
+from enum import Enum, IntEnum, auto
+
 import pytest
 
 from enumhandler import CacheStrategy, EnumHandler
 
+from . import enums
 from .enums import CapitalContinents, Capitals, Colors, UncachedColorName
 
 
@@ -27,13 +31,20 @@ def test_instances_cached_lazily():
         def blue(self):
             return "Blue"
 
-    assert LazyCachedColorName._instance_cache == {}
+    def cached_count():
+        cache = LazyCachedColorName._instance_cache_list
+        return sum(instance is not None for instance in cache)
+
+    assert cached_count() == 0
 
     for n, color in enumerate(Colors):
-        assert len(LazyCachedColorName._instance_cache) == n
+        assert cached_count() == n
         assert LazyCachedColorName(color) is LazyCachedColorName(color)
 
-    assert len(LazyCachedColorName._instance_cache) == len(Colors)
+    assert cached_count() == len(Colors)
+    assert LazyCachedColorName._instance_cache_list == [
+        LazyCachedColorName(color) for color in Colors
+    ]
 
 
 @pytest.mark.parametrize("color", Colors)
@@ -41,3 +52,106 @@ def test_instances_not_cached_for_no_caching_strategy(color):
     left = UncachedColorName(color)
     right = UncachedColorName(color)
     assert left is not right
+    assert UncachedColorName._instance_cache == {}
+
+
+@pytest.mark.parametrize("cache", [CacheStrategy.EAGER_CACHE, CacheStrategy.LAZY_CACHE])
+def test_cache_with_non_ordinal_values(cache):
+    class Shapes(Enum):
+        CIRCLE = "circle"
+        SQUARE = "square"
+
+    class ShapeSides(EnumHandler, enum=Shapes, cache=cache):
+        @EnumHandler.register(Shapes.CIRCLE)
+        def circle(self):
+            return 0
+
+        @EnumHandler.register(Shapes.SQUARE)
+        def square(self):
+            return 4
+
+    assert ShapeSides(Shapes.SQUARE) is ShapeSides(Shapes.SQUARE)
+    assert ShapeSides(Shapes.CIRCLE)() == 0
+    assert ShapeSides(Shapes.SQUARE)() == 4
+
+
+@pytest.mark.parametrize(
+    "handler, member",
+    [
+        (CapitalContinents, Colors.RED),
+        (enums.LazyCachedColorName, Capitals.AMSTERDAM),
+    ],
+)
+def test_cache_rejects_members_of_other_enums(handler, member):
+    with pytest.raises(KeyError):
+        handler(member)
+
+
+@pytest.mark.parametrize("cache", CacheStrategy)
+def test_instances_initialized_once(cache):
+    class CountingColorName(EnumHandler, enum=Colors, cache=cache):
+        initializations = 0
+
+        def __init__(self, enum_element):
+            type(self).initializations += 1
+            super().__init__(enum_element)
+
+        @EnumHandler.register(Colors.RED, Colors.GREEN, Colors.BLUE)
+        def name(self):
+            return "Color"
+
+    # Keep the instances alive, so that weakly cached ones aren't collected.
+    instances = [CountingColorName(color) for _ in range(3) for color in Colors]
+    assert len(instances) == 3 * len(Colors)
+
+    expected = 3 * len(Colors) if cache is CacheStrategy.NO_CACHE else len(Colors)
+    assert CountingColorName.initializations == expected
+
+
+def test_eager_cache_keeps_handler_state_per_member():
+    class CountingCapitals(EnumHandler, enum=Capitals):
+        calls = 0
+
+        @EnumHandler.register(*Capitals)
+        def count(self):
+            self.calls += 1
+            return self.calls
+
+    CountingCapitals(Capitals.AMSTERDAM)()
+    CountingCapitals(Capitals.AMSTERDAM)()
+    assert CountingCapitals(Capitals.LONDON)() == 1
+    assert CountingCapitals(Capitals.AMSTERDAM) is not CountingCapitals(Capitals.LONDON)
+
+
+def test_instances_cached_weakly():
+    class WeakCachedColorName(EnumHandler, enum=Colors, cache=CacheStrategy.WEAK_CACHE):
+        @EnumHandler.register(Colors.RED, Colors.GREEN, Colors.BLUE)
+        def name(self):
+            return "Color"
+
+    red = WeakCachedColorName(Colors.RED)
+    assert WeakCachedColorName(Colors.RED) is red
+    assert len(WeakCachedColorName._instance_cache) == 1
+
+    del red
+    gc.collect()
+    assert len(WeakCachedColorName._instance_cache) == 0
+
+
+@pytest.mark.parametrize("cache", [CacheStrategy.EAGER_CACHE, CacheStrategy.LAZY_CACHE])
+def test_cache_accepts_values_equal_to_int_enum_members(cache):
+    class Sizes(IntEnum):
+        SMALL = auto()
+        LARGE = auto()
+
+    class SizeName(EnumHandler, enum=Sizes, cache=cache):
+        @EnumHandler.register(Sizes.SMALL)
+        def small(self):
+            return "Small"
+
+        @EnumHandler.register(Sizes.LARGE)
+        def large(self):
+            return "Large"
+
+    assert SizeName(2) is SizeName(Sizes.LARGE)
+    assert SizeName(1)() == "Small"